@@ -1,12 +1,29 @@
+from datetime import date
+
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Value
 from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 
 from .models import BiorhythmAnalysis, BiorhythmCalculation, BiorhythmData, Person
 
+# Cycle value colours, indexed by how many of the -0.5 / 0 / 0.5 thresholds a value exceeds:
+# dark red, tomato, light green, dark green
+_CYCLE_COLORS = ("#8B0000", "#FF6347", "#32CD32", "#006400")
+# Only filled with a colour from _CYCLE_COLORS and a float, so it needs no escaping
+_CYCLE_VALUE_HTML = '<span style="color: {}; font-weight: bold;">{:.3f}</span>'
+
 
 @admin.register(Person)
 class PersonAdmin(admin.ModelAdmin):
-    list_display = ["name", "birthdate", "age_in_days", "get_biorhythm_data_count", "created_at"]
+    list_display = [
+        "name",
+        "birthdate",
+        "get_age_in_days",
+        "get_biorhythm_data_count",
+        "created_at",
+    ]
     list_filter = ["created_at", "birthdate"]
     search_fields = ["name", "email"]
     readonly_fields = ["created_at", "updated_at", "age_in_days"]
@@ -19,11 +36,30 @@ class PersonAdmin(admin.ModelAdmin):
         ),
     )
 
+    def get_queryset(self, request):
+        # Compute age and data point count in the changelist query instead of once per row
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                age_days=ExpressionWrapper(
+                    Value(date.today()) - F("birthdate"), output_field=DurationField()
+                ),
+                biorhythm_count=Count("biorhythm_entries"),
+            )
+        )
+
+    def get_age_in_days(self, obj):
+        return obj.age_days.days
+
+    get_age_in_days.short_description = "Age in days"
+    get_age_in_days.admin_order_field = "age_days"
+
     def get_biorhythm_data_count(self, obj):
-        count = obj.get_biorhythm_data_count()
-        return format_html("<strong>{}</strong> data points", count)
+        return format_html("<strong>{}</strong> data points", obj.biorhythm_count)
 
     get_biorhythm_data_count.short_description = "Data Points"
+    get_biorhythm_data_count.admin_order_field = "biorhythm_count"
 
 
 @admin.register(BiorhythmCalculation)
@@ -35,6 +71,7 @@ class BiorhythmCalculationAdmin(admin.ModelAdmin):
         "calculation_date",
         "pybiorythm_version",
     ]
+    list_select_related = ["person"]
     list_filter = ["calculation_date", "pybiorythm_version"]
     search_fields = ["person__name", "notes"]
     readonly_fields = ["calculation_date"]
@@ -55,6 +92,17 @@ class BiorhythmCalculationAdmin(admin.ModelAdmin):
     )
 
 
+class BiorhythmDataChangeList(ChangeList):
+    """Changelist that only loads the columns shown in the data point list."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        return (
+            super()
+            .get_queryset(request, exclude_parameters)
+            .only(*self.model_admin.list_display_fields)
+        )
+
+
 @admin.register(BiorhythmData)
 class BiorhythmDataAdmin(admin.ModelAdmin):
     list_display = [
@@ -66,6 +114,21 @@ class BiorhythmDataAdmin(admin.ModelAdmin):
         "intellectual_display",
         "critical_cycles_display",
     ]
+    # Model fields read by the list_display columns above; the changelist loads only these,
+    # so keep it in sync when adding a column
+    list_display_fields = [
+        "person__name",  # Person.__str__
+        "person__birthdate",
+        "date",
+        "days_alive",
+        "physical",
+        "emotional",
+        "intellectual",
+        "is_physical_critical",  # critical_cycles_display
+        "is_emotional_critical",
+        "is_intellectual_critical",
+    ]
+    list_select_related = ["person"]
     list_filter = [
         "date",
         "is_physical_critical",
@@ -95,27 +158,21 @@ class BiorhythmDataAdmin(admin.ModelAdmin):
         ("Metadata", {"fields": ("created_at", "cycle_summary"), "classes": ("collapse",)}),
     )
 
+    def get_changelist(self, request, **kwargs):
+        return BiorhythmDataChangeList
+
     def physical_display(self, obj):
-        color = self._get_cycle_color(obj.physical)
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{:.3f}</span>', color, obj.physical
-        )
+        return self._cycle_value_html(obj.physical)
 
     physical_display.short_description = "Physical"
 
     def emotional_display(self, obj):
-        color = self._get_cycle_color(obj.emotional)
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{:.3f}</span>', color, obj.emotional
-        )
+        return self._cycle_value_html(obj.emotional)
 
     emotional_display.short_description = "Emotional"
 
     def intellectual_display(self, obj):
-        color = self._get_cycle_color(obj.intellectual)
-        return format_html(
-            '<span style="color: {}; font-weight: bold;">{:.3f}</span>', color, obj.intellectual
-        )
+        return self._cycle_value_html(obj.intellectual)
 
     intellectual_display.short_description = "Intellectual"
 
@@ -129,16 +186,13 @@ class BiorhythmDataAdmin(admin.ModelAdmin):
 
     critical_cycles_display.short_description = "Critical Cycles"
 
+    def _cycle_value_html(self, value):
+        """Render a cycle value in its color."""
+        return mark_safe(_CYCLE_VALUE_HTML.format(self._get_cycle_color(value), value))
+
     def _get_cycle_color(self, value):
         """Get color based on cycle value."""
-        if value > 0.5:
-            return "#006400"  # Dark green for high positive
-        elif value > 0:
-            return "#32CD32"  # Light green for positive
-        elif value > -0.5:
-            return "#FF6347"  # Tomato for negative
-        else:
-            return "#8B0000"  # Dark red for low negative
+        return _CYCLE_COLORS[(value > -0.5) + (value > 0) + (value > 0.5)]
 
 
 @admin.register(BiorhythmAnalysis)
@@ -150,6 +204,7 @@ class BiorhythmAnalysisAdmin(admin.ModelAdmin):
         "data_points_analyzed",
         "analysis_date",
     ]
+    list_select_related = ["person"]
     list_filter = ["analysis_type", "analysis_date"]
     search_fields = ["person__name", "summary"]
     readonly_fields = ["analysis_date"]
@@ -11,12 +11,15 @@ Usage:
     python manage.py load_biorhythm_data --name "John Doe" --birthdate 1990-05-15 --days 365
     python manage.py load_biorhythm_data --name "Jane Smith" --birthdate 1985-03-22 \
         --days 730 --target-date 2024-01-01
+    python manage.py load_biorhythm_data --name "John Doe" --birthdate 1990-05-15 --vectorized
 """
 
 from datetime import date, datetime
+from itertools import islice, repeat
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import models, transaction
+from django.db import connection, transaction
+from django.utils import timezone
 
 from biorhythm_data.models import BiorhythmCalculation, BiorhythmData, Person
 
@@ -28,6 +31,39 @@ try:
 except ImportError:
     BIORYTHM_AVAILABLE = False
 
+# NumPy (installed alongside PyBiorythm) backs the --vectorized path
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# SQLite PRAGMAs applied for the duration of a load: WAL with synchronous=NORMAL avoids an
+# fsync per commit, and temp tables plus a 64 MB page cache stay in memory.
+BULK_LOAD_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": "-64000",
+}
+
+# Cycle names as reported in PyBiorythm's "critical_cycles" list
+PHYSICAL, EMOTIONAL, INTELLECTUAL = "Physical", "Emotional", "Intellectual"
+
+# Cycle lengths in days, and the absolute value below which a cycle is treated as
+# critical (near its zero crossing) by the --vectorized path
+CYCLE_PERIODS = {"physical": 23, "emotional": 28, "intellectual": 33}
+CRITICAL_THRESHOLD = 0.05
+
+# BiorhythmData columns written by the raw INSERT, in the order of each row tuple. The pk
+# and GeneratedFields are filled in by the database.
+INSERT_FIELDS = tuple(
+    field.name
+    for field in BiorhythmData._meta.concrete_fields
+    if not field.primary_key and not field.generated
+)
+
 
 class Command(BaseCommand):
     help = "Load biorhythm data for a person using PyBiorythm library"
@@ -59,12 +95,23 @@ class Command(BaseCommand):
         parser.add_argument(
             "--force", action="store_true", help="Force overwrite if person already exists"
         )
+        parser.add_argument(
+            "--vectorized",
+            action="store_true",
+            help="Compute the cycles directly with NumPy instead of PyBiorythm's JSON output",
+        )
 
     def handle(self, *args, **options):
-        if not BIORYTHM_AVAILABLE:
+        vectorized = options["vectorized"]
+        if vectorized and not NUMPY_AVAILABLE:
+            raise CommandError(
+                "NumPy is required for --vectorized. Please install it: pip install numpy"
+            )
+        if not vectorized and not BIORYTHM_AVAILABLE:
             raise CommandError(
                 "PyBiorythm library is not available. "
-                "Please install it: pip install git+https://github.com/dkdndes/pybiorythm.git"
+                "Please install it: pip install git+https://github.com/dkdndes/pybiorythm.git "
+                "or use --vectorized"
             )
 
         # Parse and validate inputs
@@ -93,46 +140,46 @@ class Command(BaseCommand):
         if days < 1 or days > 3650:  # Max ~10 years
             raise CommandError("Days must be between 1 and 3650")
 
+        if options["batch_size"] < 1:
+            raise CommandError("Batch size must be at least 1")
+
         name = options["name"]
         batch_size = options["batch_size"]
+        verbosity = options["verbosity"]
 
-        self.stdout.write(f"Loading biorhythm data for: {name}")
-        self.stdout.write(f"Birth date: {birthdate}")
-        self.stdout.write(f"Target date: {target_date}")
-        self.stdout.write(f"Days to calculate: {days}")
+        if verbosity >= 1:
+            self.stdout.write(f"Loading biorhythm data for: {name}")
+            self.stdout.write(f"Birth date: {birthdate}")
+            self.stdout.write(f"Target date: {target_date}")
+            self.stdout.write(f"Days to calculate: {days}")
 
         # Check if person already exists
-        try:
-            person = Person.objects.get(name=name, birthdate=birthdate)
-            if not options["force"]:
-                raise CommandError(
-                    f"Person '{name}' with birthdate {birthdate} already exists. "
-                    "Use --force to overwrite."
-                )
-            else:
-                self.stdout.write("Person exists, will update data (--force specified)")
-        except Person.DoesNotExist:
-            person = None
+        if not options["force"] and Person.objects.filter(name=name, birthdate=birthdate).exists():
+            raise CommandError(
+                f"Person '{name}' with birthdate {birthdate} already exists. "
+                "Use --force to overwrite."
+            )
+
+        previous_pragmas = {}
 
         try:
-            with transaction.atomic():
-                # Create or update person
-                if person:
-                    person.email = options["email"] or person.email
-                    person.notes = options["notes"] or person.notes
-                    person.save()
-                else:
-                    person = Person.objects.create(
-                        name=name,
-                        birthdate=birthdate,
-                        email=options["email"],
-                        notes=options["notes"],
-                    )
+            self._apply_pragmas(BULK_LOAD_PRAGMAS, previous_pragmas)
 
-                self.stdout.write(f"✅ Person record: {person}")
+            # Generate biorhythm data before opening the transaction, so the SQLite write
+            # lock is only held while writing
+            if vectorized:
+                if verbosity >= 2:
+                    self.stdout.write("🔄 Computing biorhythm cycles with NumPy...")
 
-                # Generate biorhythm data using PyBiorythm
-                self.stdout.write("🔄 Generating biorhythm data with PyBiorythm...")
+                cycles, critical_days = self._compute_cycles(birthdate, target_date, days)
+
+                start_date = cycles["date"][0]
+                end_date = cycles["date"][-1]
+                total_points = days
+                version = f"numpy {np.__version__}"
+            else:
+                if verbosity >= 2:
+                    self.stdout.write("🔄 Generating biorhythm data with PyBiorythm...")
 
                 calc = BiorhythmCalculator(days=days)
                 birthdate_dt = datetime.combine(birthdate, datetime.min.time())
@@ -140,100 +187,215 @@ class Command(BaseCommand):
 
                 biorhythm_json = calc.generate_timeseries_json(birthdate_dt, target_date_dt)
 
-                # Create calculation record
-                start_date = datetime.strptime(biorhythm_json["data"][0]["date"], "%Y-%m-%d").date()
-                end_date = datetime.strptime(biorhythm_json["data"][-1]["date"], "%Y-%m-%d").date()
+                data = biorhythm_json["data"]
+                start_date = datetime.strptime(data[0]["date"], "%Y-%m-%d").date()
+                end_date = datetime.strptime(data[-1]["date"], "%Y-%m-%d").date()
+                total_points = len(data)
+                critical_days = 0
+                version = biorhythm_json.get("meta", {}).get("version", "unknown")
+
+            with transaction.atomic():
+                # Create or update person, keeping stored details that weren't given
+                person, created = Person.objects.update_or_create(
+                    name=name,
+                    birthdate=birthdate,
+                    defaults={
+                        field: options[field] for field in ("email", "notes") if options[field]
+                    },
+                )
+
+                if not created and verbosity >= 1:
+                    self.stdout.write("Person exists, updated data (--force specified)")
+                if verbosity >= 2:
+                    self.stdout.write(f"✅ Person record: {person}")
 
+                # Create calculation record
                 calculation = BiorhythmCalculation.objects.create(
                     person=person,
                     start_date=start_date,
                     end_date=end_date,
-                    days_calculated=len(biorhythm_json["data"]),
+                    days_calculated=total_points,
                     target_date=target_date,
-                    pybiorythm_version=biorhythm_json.get("meta", {}).get("version", "unknown"),
+                    pybiorythm_version=version,
                     notes=f"Generated via management command with {days} days",
                 )
 
-                self.stdout.write(f"✅ Calculation record: {calculation}")
+                if verbosity >= 2:
+                    self.stdout.write(f"✅ Calculation record: {calculation}")
 
                 # Delete existing data for this person if force is specified
+                # Nothing references BiorhythmData and no signals are connected to it, so a
+                # plain DELETE skips the ORM collector without losing any cascades.
                 if options["force"]:
-                    deleted_count = BiorhythmData.objects.filter(person=person).delete()[0]
-                    if deleted_count > 0:
+                    quote_name = connection.ops.quote_name
+                    table = quote_name(BiorhythmData._meta.db_table)
+                    column = quote_name(BiorhythmData._meta.get_field("person").column)
+                    with connection.cursor() as cursor:
+                        cursor.execute(f"DELETE FROM {table} WHERE {column} = %s", [person.pk])
+                        deleted_count = cursor.rowcount
+                    if deleted_count > 0 and verbosity >= 2:
                         self.stdout.write(f"🗑️  Deleted {deleted_count} existing data points")
 
                 # Process biorhythm data in batches
-                data_points = []
-                total_points = len(biorhythm_json["data"])
+                total_saved = 0
 
-                self.stdout.write(
-                    f"📊 Processing {total_points} data points in batches of {batch_size}..."
-                )
+                # Rows are plain tuples for executemany; auto_now_add is not applied outside
+                # the ORM, so created_at is filled in here
+                created_at = connection.ops.adapt_datetimefield_value(timezone.now())
+                # Plain ints, so each row doesn't go through the pk property
+                person_id = person.pk
+                calculation_id = calculation.pk
 
-                for i, day_data in enumerate(biorhythm_json["data"]):
-                    # Parse critical cycles
-                    critical_cycles = day_data.get("critical_cycles", [])
-                    is_physical_critical = "Physical" in critical_cycles
-                    is_emotional_critical = "Emotional" in critical_cycles
-                    is_intellectual_critical = "Intellectual" in critical_cycles
-
-                    data_point = BiorhythmData(
-                        person=person,
-                        calculation=calculation,
-                        date=datetime.strptime(day_data["date"], "%Y-%m-%d").date(),
-                        days_alive=day_data["days_alive"],
-                        physical=day_data["physical"],
-                        emotional=day_data["emotional"],
-                        intellectual=day_data["intellectual"],
-                        is_physical_critical=is_physical_critical,
-                        is_emotional_critical=is_emotional_critical,
-                        is_intellectual_critical=is_intellectual_critical,
+                if verbosity >= 2:
+                    self.stdout.write(
+                        f"📊 Processing {total_points} data points in batches of {batch_size}..."
                     )
-                    data_points.append(data_point)
-
-                    # Insert batch when full
-                    if len(data_points) >= batch_size:
-                        BiorhythmData.objects.bulk_create(data_points)
-                        self.stdout.write(
-                            f"💾 Saved batch: {i + 1 - len(data_points) + 1}-{i + 1} of "
-                            f"{total_points}"
+
+                def iter_rows():
+                    """Yield one INSERT tuple per day so only a single batch is held in memory."""
+                    nonlocal critical_days
+                    # fromisoformat is a C-level parser for YYYY-MM-DD
+                    parse_date = date.fromisoformat
+
+                    for day_data in data:
+                        # Parse critical cycles
+                        critical_cycles = frozenset(day_data.get("critical_cycles") or ())
+                        is_physical_critical = PHYSICAL in critical_cycles
+                        is_emotional_critical = EMOTIONAL in critical_cycles
+                        is_intellectual_critical = INTELLECTUAL in critical_cycles
+                        is_any_critical = (
+                            is_physical_critical
+                            or is_emotional_critical
+                            or is_intellectual_critical
+                        )
+                        critical_days += is_any_critical
+
+                        yield (
+                            person_id,
+                            calculation_id,
+                            parse_date(day_data["date"]),
+                            day_data["days_alive"],
+                            day_data["physical"],
+                            day_data["emotional"],
+                            day_data["intellectual"],
+                            is_physical_critical,
+                            is_emotional_critical,
+                            is_intellectual_critical,
+                            created_at,
                         )
-                        data_points = []
 
-                # Insert remaining data points
-                if data_points:
-                    BiorhythmData.objects.bulk_create(data_points)
-                    self.stdout.write(
-                        f"💾 Saved final batch: {total_points - len(data_points) + 1}-"
-                        f"{total_points}"
+                # Rebuilding an index covers the whole table, so the secondary indexes are
+                # only dropped during the insert and rebuilt afterwards when the new rows
+                # outnumber the existing ones (e.g. an empty table); otherwise updating them
+                # per row is cheaper. The unique (person, date) constraint always stays in
+                # place, and this is only done where DDL is transactional, so a failed load
+                # restores the indexes.
+                recreate_indexes = []
+                if (
+                    connection.features.can_rollback_ddl
+                    and BiorhythmData.objects.count() <= total_points
+                ):
+                    recreate_indexes = self._drop_indexes(BiorhythmData)
+
+                # Insert through the cursor to skip building a model instance per row
+                insert_sql = self._insert_sql(BiorhythmData, INSERT_FIELDS)
+                if vectorized:
+                    rows = zip(
+                        repeat(person_id),
+                        repeat(calculation_id),
+                        *(cycles[field] for field in INSERT_FIELDS[2:-1]),
+                        repeat(created_at),
                     )
+                else:
+                    rows = iter_rows()
+                with connection.cursor() as cursor:
+                    while batch := list(islice(rows, batch_size)):
+                        assert len(batch[0]) == len(INSERT_FIELDS), (
+                            "Row does not match INSERT_FIELDS"
+                        )
+                        cursor.executemany(insert_sql, batch)
+                        batch_start = total_saved + 1
+                        total_saved += len(batch)
+                        if verbosity >= 2:
+                            self.stdout.write(
+                                f"💾 Saved batch: {batch_start}-{total_saved} of {total_points}"
+                            )
+                    for sql in recreate_indexes:
+                        cursor.execute(sql)
 
                 # Summary
-                total_saved = BiorhythmData.objects.filter(person=person).count()
-                critical_days = (
-                    BiorhythmData.objects.filter(person=person)
-                    .filter(
-                        models.Q(is_physical_critical=True)
-                        | models.Q(is_emotional_critical=True)
-                        | models.Q(is_intellectual_critical=True)
-                    )
-                    .count()
-                )
-
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"\n🎉 Successfully loaded biorhythm data!\n"
-                        f"   Person: {person.name}\n"
-                        f"   Data points: {total_saved}\n"
-                        f"   Date range: {start_date} to {end_date}\n"
-                        f"   Critical days: {critical_days}\n"
-                        f"   Database: SQLite ({calculation.id})"
+                if verbosity >= 1:
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f"\n🎉 Successfully loaded biorhythm data!\n"
+                            f"   Person: {person.name}\n"
+                            f"   Data points: {total_saved}\n"
+                            f"   Date range: {start_date} to {end_date}\n"
+                            f"   Critical days: {critical_days}\n"
+                            f"   Database: SQLite ({calculation.id})"
+                        )
                     )
-                )
 
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"❌ Error loading data: {str(e)}"))
             raise CommandError(f"Failed to load biorhythm data: {str(e)}") from e
-
-
-# Django Q objects already imported above
+        finally:
+            self._apply_pragmas(previous_pragmas, {})
+
+    def _compute_cycles(self, birthdate, start_date, days):
+        """
+        Compute daily cycle values and critical flags with NumPy.
+
+        Returns a dict of per-day lists keyed by BiorhythmData field name, and the
+        number of days on which any cycle is critical.
+        """
+        offsets = np.arange(days, dtype=np.int64)
+        days_alive = (start_date - birthdate).days + offsets
+        any_critical = np.zeros(days, dtype=bool)
+
+        cycles = {
+            "date": (np.datetime64(start_date, "D") + offsets).tolist(),
+            "days_alive": days_alive.tolist(),
+        }
+        for cycle, period in CYCLE_PERIODS.items():
+            values = np.sin(2 * np.pi * days_alive / period)
+            critical = np.abs(values) < CRITICAL_THRESHOLD
+            any_critical |= critical
+            cycles[cycle] = values.tolist()
+            cycles[f"is_{cycle}_critical"] = critical.tolist()
+
+        return cycles, int(any_critical.sum())
+
+    def _insert_sql(self, model, field_names):
+        """Build a parameterised INSERT statement for the given model fields."""
+        quote_name = connection.ops.quote_name
+        columns = ", ".join(quote_name(model._meta.get_field(f).column) for f in field_names)
+        placeholders = ", ".join(["%s"] * len(field_names))
+        return f"INSERT INTO {quote_name(model._meta.db_table)} ({columns}) VALUES ({placeholders})"
+
+    def _drop_indexes(self, model):
+        """Drop the ``Meta.indexes`` of a model and return the SQL that recreates them."""
+        schema_editor = connection.schema_editor()
+        recreate = []
+        with connection.cursor() as cursor:
+            for index in model._meta.indexes:
+                recreate.append(str(index.create_sql(model, schema_editor)))
+                cursor.execute(f"DROP INDEX {schema_editor.quote_name(index.name)}")
+        return recreate
+
+    def _apply_pragmas(self, pragmas, previous):
+        """
+        Set SQLite PRAGMAs, recording the prior value of each one changed in ``previous``.
+
+        Skipped on other backends and inside an open transaction, where SQLite refuses to
+        change the journal mode or synchronous level.
+        """
+        if connection.vendor != "sqlite" or connection.in_atomic_block:
+            return
+
+        with connection.cursor() as cursor:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}")
+                current = cursor.fetchone()[0]
+                cursor.execute(f"PRAGMA {name} = {value}")
+                previous[name] = current
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-15 19:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("biorhythm_data", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="biorhythmdata",
+            name="calculation",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="data_points",
+                to="biorhythm_data.biorhythmcalculation",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="biorhythmdata",
+            name="person",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="biorhythm_entries",
+                to="biorhythm_data.person",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="biorhythmdata",
+            index=models.Index(
+                fields=["calculation", "person"], name="biorhythm_d_calcula_b586e0_idx"
+            ),
+        ),
+    ]
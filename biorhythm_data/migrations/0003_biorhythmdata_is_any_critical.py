@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("biorhythm_data", "0002_biorhythmdata_fk_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="biorhythmdata",
+            name="biorhythm_d_is_phys_93cd0a_idx",
+        ),
+        migrations.AddField(
+            model_name="biorhythmdata",
+            name="is_any_critical",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Q(
+                    ("is_physical_critical", True),
+                    ("is_emotional_critical", True),
+                    ("is_intellectual_critical", True),
+                    _connector="OR",
+                ),
+                help_text="Any cycle near zero crossing",
+                output_field=models.BooleanField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="biorhythmdata",
+            index=models.Index(fields=["is_any_critical"], name="biorhythm_d_is_any__f20882_idx"),
+        ),
+    ]
@@ -77,13 +77,18 @@ class BiorhythmData(models.Model):
     Each record represents one day's biorhythm values for a person.
     """
 
-    person = models.ForeignKey(Person, on_delete=models.CASCADE, related_name="biorhythm_entries")
+    # Foreign key lookups are served by the composite indexes in Meta, so the
+    # single-column indexes Django would add for them are skipped
+    person = models.ForeignKey(
+        Person, on_delete=models.CASCADE, related_name="biorhythm_entries", db_index=False
+    )
     calculation = models.ForeignKey(
         BiorhythmCalculation,
         on_delete=models.CASCADE,
         related_name="data_points",
         null=True,
         blank=True,
+        db_index=False,
     )
     date = models.DateField(help_text="Date for this biorhythm reading")
     days_alive = models.PositiveIntegerField(help_text="Number of days since birth")
@@ -112,6 +117,16 @@ class BiorhythmData(models.Model):
     is_intellectual_critical = models.BooleanField(
         default=False, help_text="Intellectual cycle near zero crossing"
     )
+    # Computed by the database from the three flags, so it can't go stale, and stored so
+    # critical-day lookups are a single indexed equality instead of a 3-way OR
+    is_any_critical = models.GeneratedField(
+        expression=models.Q(is_physical_critical=True)
+        | models.Q(is_emotional_critical=True)
+        | models.Q(is_intellectual_critical=True),
+        output_field=models.BooleanField(),
+        db_persist=True,
+        help_text="Any cycle near zero crossing",
+    )
 
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
@@ -123,11 +138,10 @@ class BiorhythmData(models.Model):
         verbose_name_plural = "Biorhythm Data Points"
         indexes = [
             models.Index(fields=["person", "date"]),
+            models.Index(fields=["calculation", "person"]),
             models.Index(fields=["date"]),
             models.Index(fields=["days_alive"]),
-            models.Index(
-                fields=["is_physical_critical", "is_emotional_critical", "is_intellectual_critical"]
-            ),
+            models.Index(fields=["is_any_critical"]),
         ]
 
     def __str__(self):
@@ -136,13 +150,6 @@ class BiorhythmData(models.Model):
             f"E={self.emotional:.3f}, I={self.intellectual:.3f}"
         )
 
-    @property
-    def is_any_critical(self):
-        """Check if any cycle is in critical phase."""
-        return (
-            self.is_physical_critical or self.is_emotional_critical or self.is_intellectual_critical
-        )
-
     @property
     def critical_cycles(self):
         """Get list of cycles that are in critical phase."""
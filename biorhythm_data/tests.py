@@ -1 +1,162 @@
-# Create your tests here.
+import math
+from datetime import date, datetime, timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase
+from django.utils import timezone
+
+from .models import BiorhythmData, Person
+
+COMMAND_MODULE = "biorhythm_data.management.commands.load_biorhythm_data"
+
+
+class FakeBiorhythmCalculator:
+    """Stand-in for PyBiorythm's calculator that returns the same JSON layout."""
+
+    periods = {"Physical": 23, "Emotional": 28, "Intellectual": 33}
+
+    def __init__(self, days=30):
+        self.days = days
+
+    def generate_timeseries_json(self, birthdate, target_date):
+        data = []
+        for offset in range(self.days):
+            day = target_date + timedelta(days=offset)
+            days_alive = (day - birthdate).days
+            values = {
+                cycle: math.sin(2 * math.pi * days_alive / period)
+                for cycle, period in self.periods.items()
+            }
+            data.append(
+                {
+                    "date": day.strftime("%Y-%m-%d"),
+                    "days_alive": days_alive,
+                    "physical": values["Physical"],
+                    "emotional": values["Emotional"],
+                    "intellectual": values["Intellectual"],
+                    "critical_cycles": [c for c, v in values.items() if abs(v) < 0.05],
+                }
+            )
+        return {"meta": {"version": "test"}, "data": data}
+
+
+@patch.multiple(
+    COMMAND_MODULE,
+    BIORYTHM_AVAILABLE=True,
+    BiorhythmCalculator=FakeBiorhythmCalculator,
+    create=True,
+)
+class LoadBiorhythmDataTests(TestCase):
+    def load(self, *args, **kwargs):
+        out = StringIO()
+        call_command(
+            "load_biorhythm_data",
+            "--name",
+            "Test User",
+            "--birthdate",
+            "1990-05-15",
+            "--target-date",
+            "2024-01-01",
+            *args,
+            stdout=out,
+            **kwargs,
+        )
+        return out.getvalue()
+
+    def test_loads_pybiorythm_data(self):
+        before = timezone.now()
+        output = self.load("--days", "365")
+
+        data = BiorhythmData.objects.all()
+        expected = FakeBiorhythmCalculator(days=365).generate_timeseries_json(
+            datetime(1990, 5, 15), datetime(2024, 1, 1)
+        )["data"]
+        expected_critical = sum(1 for day in expected if day["critical_cycles"])
+
+        self.assertEqual(data.count(), 365)
+        self.assertGreater(expected_critical, 0)
+        self.assertIn(f"Critical days: {expected_critical}", output)
+        self.assertEqual(data.filter(is_any_critical=True).count(), expected_critical)
+
+        first = data.get(date=date(2024, 1, 1))
+        self.assertEqual(first.days_alive, expected[0]["days_alive"])
+        self.assertAlmostEqual(first.physical, expected[0]["physical"])
+        self.assertEqual(first.calculation.days_calculated, 365)
+        self.assertFalse(data.filter(created_at__isnull=True).exists())
+        self.assertGreaterEqual(first.created_at, before)
+
+    def test_force_replaces_existing_data(self):
+        self.load("--days", "30", verbosity=0)
+        output = self.load("--days", "10", "--force", verbosity=2)
+
+        self.assertIn("Deleted 30 existing data points", output)
+        self.assertEqual(Person.objects.count(), 1)
+        self.assertEqual(BiorhythmData.objects.count(), 10)
+
+    def test_indexes_are_rebuilt(self):
+        self.load("--days", "30", verbosity=0)
+
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, BiorhythmData._meta.db_table
+            )
+        for index in BiorhythmData._meta.indexes:
+            self.assertIn(index.name, constraints)
+
+    def test_vectorized_load(self):
+        output = self.load("--days", "100", "--vectorized")
+
+        data = list(BiorhythmData.objects.order_by("date"))
+        days_alive = (date(2024, 1, 1) - date(1990, 5, 15)).days
+
+        self.assertEqual(len(data), 100)
+        self.assertEqual(
+            [point.date for point in data],
+            [date(2024, 1, 1) + timedelta(days=offset) for offset in range(100)],
+        )
+        self.assertEqual(
+            [point.days_alive for point in data], list(range(days_alive, days_alive + 100))
+        )
+
+        point = data[10]
+        self.assertAlmostEqual(point.physical, math.sin(2 * math.pi * (days_alive + 10) / 23))
+        self.assertAlmostEqual(point.emotional, math.sin(2 * math.pi * (days_alive + 10) / 28))
+        self.assertAlmostEqual(point.intellectual, math.sin(2 * math.pi * (days_alive + 10) / 33))
+
+        critical_days = BiorhythmData.objects.filter(is_any_critical=True).count()
+        self.assertGreater(critical_days, 0)
+        self.assertIn(f"Critical days: {critical_days}", output)
+
+    def test_runs_inside_open_transaction(self):
+        with transaction.atomic():
+            self.load("--days", "30", verbosity=0)
+
+        self.assertEqual(BiorhythmData.objects.count(), 30)
+        self.assertEqual(Person.objects.count(), 1)
+
+
+class BiorhythmDataModelTests(TestCase):
+    def test_is_any_critical_follows_flag_updates(self):
+        person = Person.objects.create(name="Test User", birthdate=date(1990, 5, 15))
+        BiorhythmData.objects.create(
+            person=person,
+            date=date(2024, 1, 1),
+            days_alive=12284,
+            physical=0.5,
+            emotional=0.5,
+            intellectual=0.5,
+        )
+        data = BiorhythmData.objects.filter(person=person)
+        self.assertFalse(data.filter(is_any_critical=True).exists())
+
+        data.update(is_emotional_critical=True)
+        self.assertTrue(data.get().is_any_critical)
+
+        data.update(is_emotional_critical=False, is_intellectual_critical=True)
+        self.assertTrue(data.get().is_any_critical)
+
+        data.update(is_intellectual_critical=False)
+        self.assertFalse(data.filter(is_any_critical=True).exists())
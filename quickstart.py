@@ -47,6 +47,7 @@ def main():
 
     if data_count == 0:
         print("📊 Loading biorhythm data...")
+        # --force because the person record was created above
         call_command(
             "load_biorhythm_data",
             "--name",
@@ -57,6 +58,8 @@ def main():
             "90",
             "--notes",
             "Quick start demo data",
+            "--force",
+            verbosity=0,
         )
         data_count = BiorhythmData.objects.filter(person=person).count()
         print(f"✅ Loaded {data_count} data points")
@@ -68,7 +71,11 @@ def main():
     print("-" * 30)
 
     # Get recent data
-    recent_data = BiorhythmData.objects.filter(person=person).order_by("-date")[:5]
+    recent_data = (
+        BiorhythmData.objects.filter(person=person)
+        .only("date", "physical", "emotional", "intellectual")
+        .order_by("-date")[:5]
+    )
 
     if recent_data:
         print(f"📅 Most recent date: {recent_data[0].date}")
@@ -77,15 +84,9 @@ def main():
         print(f"🧠 Intellectual: {recent_data[0].intellectual:.3f}")
 
         # Critical days
-        critical_days = (
-            BiorhythmData.objects.filter(person=person, date__gte=date.today() - timedelta(days=30))
-            .filter(
-                models.Q(is_physical_critical=True)
-                | models.Q(is_emotional_critical=True)
-                | models.Q(is_intellectual_critical=True)
-            )
-            .count()
-        )
+        critical_days = BiorhythmData.objects.filter(
+            person=person, date__gte=date.today() - timedelta(days=30), is_any_critical=True
+        ).count()
 
         print(f"⚠️  Critical days (last 30): {critical_days}")
 
@@ -111,7 +112,4 @@ def main():
 
 
 if __name__ == "__main__":
-    # Import models here to avoid circular imports
-    from django.db import models
-
     main()